@@ -1,13 +1,30 @@
 """Mac App Positioner - A utility for positioning macOS applications across monitors"""
 
-from .display import DisplayManager
-from .application import ApplicationManager
-from .profiles import ProfileManager
-from .config import load_config
+from functools import cached_property
 
 class MacAppPositioner:
+    """Entry point object; managers (and their PyObjC imports) load on first access."""
+
     def __init__(self, config_path="config.yaml", verbose=False):
-        self.config = load_config(config_path)
-        self.display_manager = DisplayManager(verbose=verbose)
-        self.app_manager = ApplicationManager(verbose=verbose)
-        self.profile_manager = ProfileManager(self.config, self.display_manager, self.app_manager, verbose=verbose)
+        self.config_path = config_path
+        self.verbose = verbose
+
+    @cached_property
+    def config(self):
+        from .config import load_config
+        return load_config(self.config_path)
+
+    @cached_property
+    def display_manager(self):
+        from .display import DisplayManager
+        return DisplayManager(verbose=self.verbose)
+
+    @cached_property
+    def app_manager(self):
+        from .application import ApplicationManager
+        return ApplicationManager(verbose=self.verbose)
+
+    @cached_property
+    def profile_manager(self):
+        from .profiles import ProfileManager
+        return ProfileManager(self.config, self.display_manager, self.app_manager, verbose=self.verbose)
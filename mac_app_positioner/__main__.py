@@ -3,95 +3,124 @@
 Mac App Positioner - A utility for positioning macOS applications across monitors
 """
 
+import argparse
+import functools
 import sys
 import os
 from mac_app_positioner import MacAppPositioner
 
+HELP_TEXT = """\
+Mac App Positioner
+Commands:
+  list-screens            - List connected screens (NSScreen)
+  list-screens-enhanced   - List screens with enhanced detection (pymonctl)
+  list-apps               - List running applications
+  detect                  - Detect current profile
+  position                - Position applications automatically
+  position <profile>      - Position applications using specific profile
+
+Configuration:
+  generate-config <profile> - Show suggested config for current setup
+  update-profile <profile>  - Interactively update profile with current setup
+  quick-update <profile>    - Quickly update profile (no confirmation)
+  check-permissions         - Check if accessibility permissions are granted
+
+Options:
+  --verbose                 - Show detailed debugging information and positioning details"""
+
+PERMISSION_STEPS = """\
+❌ Accessibility permissions not granted
+Please grant permissions in:
+System Preferences > Privacy & Security > Accessibility
+
+You need to add the Python interpreter that's running this script:
+Python executable (symlink): {executable}
+Real Python executable: {real_python}
+Current process PID: {pid}
+
+Steps:
+1. Open System Preferences > Privacy & Security > Accessibility
+2. Click the '+' button
+3. Press Cmd+Shift+G and paste this path:
+   {real_python}
+4. Select the executable and add it to the list"""
+
+@functools.cache
+def _real_python():
+    """Resolved interpreter path; computed only when a command needs it."""
+    return os.path.realpath(sys.executable)
+
+def _detect(positioner, args):
+    profile = positioner.profile_manager.detect_profile()
+    print(f"Detected profile: {profile or 'None'}")
+
+def _position(positioner, args):
+    profile = args.args[0] if args.args else None
+    positioner.profile_manager.position_applications(profile)
+
+def _with_profile(command, handler):
+    """Wrap a handler that requires a <profile-name> argument."""
+    def run(positioner, args):
+        if not args.args:
+            print(f"Usage: {command} <profile-name>")
+        else:
+            handler(positioner, args.args[0])
+    return run
+
+def _check_permissions(positioner, args):
+    if positioner.app_manager.check_accessibility_permissions():
+        print("✅ Accessibility permissions are granted")
+    else:
+        print(PERMISSION_STEPS.format(executable=sys.executable, real_python=_real_python(), pid=os.getpid()))
+
+# Each handler only touches the manager it needs, so unrelated PyObjC modules never load
+COMMANDS = {
+    "list-screens": lambda p, a: p.display_manager.list_screens(),
+    "list-screens-enhanced": lambda p, a: p.display_manager.list_screens_enhanced(),
+    "list-apps": lambda p, a: p.app_manager.list_applications(),
+    "detect": _detect,
+    "position": _position,
+    "update-profile": _with_profile("update-profile", lambda p, name: p.profile_manager.update_profile_interactive(name)),
+    "quick-update": _with_profile("quick-update", lambda p, name: p.profile_manager.quick_update_profile(name)),
+    "generate-config": _with_profile("generate-config", lambda p, name: p.profile_manager.generate_profile_config(name)),
+    "check-permissions": _check_permissions,
+}
+
+def parse_args(argv=None):
+    """Parse command line arguments; --verbose may appear anywhere on the line.
+
+    Any other option is returned as the command, so main reports it as unknown.
+    """
+    parser = argparse.ArgumentParser(prog="positioner", add_help=False, allow_abbrev=False)
+    parser.add_argument("--verbose", action="store_true")
+    parser.add_argument("command", nargs="?")
+    parser.add_argument("args", nargs="*")
+    args, unknown = parser.parse_known_intermixed_args(argv)
+    if unknown:
+        args.command, args.args = unknown[0], []
+    return args
+
 def main():
     """Main function for the Mac App Positioner CLI."""
-    verbose = "--verbose" in sys.argv
-    if verbose:
-        sys.argv.remove("--verbose")
-
-    positioner = MacAppPositioner(verbose=verbose)
-    args = sys.argv[1:]
+    args = parse_args()
 
-    if not args:
+    if not args.command:
         print_help()
         sys.exit(0)
 
-    command = args[0]
-
-    if command == "list-screens":
-        positioner.display_manager.list_screens()
-    elif command == "list-screens-enhanced":
-        positioner.display_manager.list_screens_enhanced()
-    elif command == "list-apps":
-        positioner.app_manager.list_applications()
-    elif command == "detect":
-        profile = positioner.profile_manager.detect_profile()
-        print(f"Detected profile: {profile or 'None'}")
-    elif command == "position":
-        profile = args[1] if len(args) > 1 else None
-        positioner.profile_manager.position_applications(profile)
-    elif command == "update-profile":
-        if len(args) < 2:
-            print("Usage: update-profile <profile-name>")
-        else:
-            positioner.profile_manager.update_profile_interactive(args[1])
-    elif command == "quick-update":
-        if len(args) < 2:
-            print("Usage: quick-update <profile-name>")
-        else:
-            positioner.profile_manager.quick_update_profile(args[1])
-    elif command == "generate-config":
-        if len(args) < 2:
-            print("Usage: generate-config <profile-name>")
-        else:
-            positioner.profile_manager.generate_profile_config(args[1])
-    elif command == "check-permissions":
-        if positioner.app_manager.check_accessibility_permissions():
-            print("✅ Accessibility permissions are granted")
-        else:
-            print("❌ Accessibility permissions not granted")
-            print("Please grant permissions in:")
-            print("System Preferences > Privacy & Security > Accessibility")
-            print("")
-            print("You need to add the Python interpreter that's running this script:")
-            real_python = os.path.realpath(sys.executable)
-            print(f"Python executable (symlink): {sys.executable}")
-            print(f"Real Python executable: {real_python}")
-            print(f"Current process PID: {os.getpid()}")
-            print("")
-            print("Steps:")
-            print("1. Open System Preferences > Privacy & Security > Accessibility")
-            print("2. Click the '+' button")
-            print("3. Press Cmd+Shift+G and paste this path:")
-            print(f"   {real_python}")
-            print("4. Select the executable and add it to the list")
-    else:
-        print(f"Unknown command: {command}")
+    handler = COMMANDS.get(args.command)
+    if handler is None:
+        print(f"Unknown command: {args.command}")
         print_help()
+        return
+
+    # Managers are created lazily, so each handler only imports what it touches
+    positioner = MacAppPositioner(verbose=args.verbose)
+    handler(positioner, args)
 
 def print_help():
     """Prints the help message."""
-    print("Mac App Positioner")
-    print("Commands:")
-    print("  list-screens            - List connected screens (NSScreen)")
-    print("  list-screens-enhanced   - List screens with enhanced detection (pymonctl)")
-    print("  list-apps               - List running applications")
-    print("  detect                  - Detect current profile")
-    print("  position                - Position applications automatically")
-    print("  position <profile>      - Position applications using specific profile")
-    print("")
-    print("Configuration:")
-    print("  generate-config <profile> - Show suggested config for current setup")
-    print("  update-profile <profile>  - Interactively update profile with current setup")
-    print("  quick-update <profile>    - Quickly update profile (no confirmation)")
-    print("  check-permissions         - Check if accessibility permissions are granted")
-    print("")
-    print("Options:")
-    print("  --verbose                 - Show detailed debugging information and positioning details")
+    print(HELP_TEXT)
 
 if __name__ == "__main__":
     main()
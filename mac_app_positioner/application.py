@@ -1,67 +1,223 @@
 """Application management for Mac App Positioner."""
 
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
+import objc
 from Cocoa import NSWorkspace
-from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID
+from Quartz import CGWindowListCopyWindowInfo, kCGWindowListOptionOnScreenOnly, kCGNullWindowID, CGGetDisplaysWithPoint
 from ApplicationServices import (
     AXUIElementCreateApplication, AXUIElementCopyAttributeNames,
-    AXUIElementCopyAttributeValue, AXUIElementSetAttributeValue,
+    AXUIElementCopyAttributeValue, AXUIElementCopyMultipleAttributeValues,
+    AXUIElementSetAttributeValue,
     AXValueCreate, AXValueGetValue, kAXValueCGPointType, kAXValueCGSizeType,
     kAXWindowsAttribute, kAXPositionAttribute, kAXSizeAttribute,
     kAXMainAttribute, AXUIElementPerformAction, kAXRaiseAction,
-    AXIsProcessTrusted
+    AXIsProcessTrusted, AXObserverCreate, AXObserverAddNotification,
+    AXObserverRemoveNotification, AXObserverGetRunLoopSource, kAXMovedNotification
 )
+from CoreFoundation import (
+    CFRunLoopGetCurrent, CFRunLoopAddSource, CFRunLoopRemoveSource,
+    CFRunLoopRunInMode, kCFRunLoopDefaultMode, kCFRunLoopRunHandledSource
+)
+from .geometry import Rect, Size
+from .output import routed_stdout, run_captured
+
+_WORKSPACE = NSWorkspace.sharedWorkspace()
+_RUNNING = _WORKSPACE.runningApplications
+_POS_SIZE_ATTRS = (kAXPositionAttribute, kAXSizeAttribute)
+
+# quadrant -> (quad width, window width, quad height, window height) factors for corner alignment
+_QUAD = {
+    'top_left': (0, 0, 0, 0),
+    'top_right': (1, 1, 0, 0),
+    'bottom_left': (0, 0, 1, 1),
+    'bottom_right': (1, 1, 1, 1),
+}
 
-try:
-    import pyautogui
-    PYAUTOGUI_AVAILABLE = True
-except ImportError:
-    PYAUTOGUI_AVAILABLE = False
+@functools.lru_cache(maxsize=64)
+def _corner_aligned_rect(quadrant, quad_x, quad_y, quad_width, quad_height, window_width, window_height):
+    """Rect for a window of the given size pushed into the quadrant's named corner (memoized; Rect is immutable)"""
+    fwq, fww, fhq, fhw = _QUAD.get(quadrant, (0, 0, 0, 0))
+    return Rect(
+        quad_x + fwq * quad_width - fww * window_width,
+        quad_y + fhq * quad_height - fhw * window_height,
+        window_width,
+        window_height
+    )
+
+# Seconds a cached AX application ref / window size stays valid
+AX_CACHE_TTL = 2.0
+
+def _on_ax_notification(observer, element, notification, refcon):
+    """AXObserver callback; only needs to exist so the run loop returns once the event is handled"""
 
 class ApplicationManager:
+    __slots__ = ('verbose', '_ax_app_cache', '_windows_cache', '_win_size_cache', '_apps_snapshot', '_trusted', '_last_targets')
+
     def __init__(self, verbose=False):
         self.verbose = verbose
-        if verbose:
-            if PYAUTOGUI_AVAILABLE:
-                print("✅ pyautogui available - positioning validation enabled")
-            else:
-                print("⚠️  pyautogui not available - no positioning validation")
+        self._ax_app_cache = {}  # pid -> (timestamp, AXUIElement)
+        self._windows_cache = {}  # pid -> (timestamp, AX window elements)
+        self._win_size_cache = {}  # pid -> (timestamp, {'width', 'height'})
+        self._apps_snapshot = None
+        self._trusted = None
+        self._last_targets = {}  # pid -> Rect the window was last moved to
 
     def print_verbose(self, message):
         """Print message only if verbose mode is enabled"""
         if self.verbose:
             print(message)
 
-    def get_running_applications(self):
-        """Get list of running applications"""
-        workspace = NSWorkspace.sharedWorkspace()
-        running_apps = workspace.runningApplications()
-        
+    def get_running_applications(self, wanted_bundle_ids=None):
+        """Get list of running applications (the unfiltered snapshot is reused)
+
+        With wanted_bundle_ids, only those apps are materialized and the shared snapshot is
+        left untouched. Hidden apps are always skipped.
+        """
+        if wanted_bundle_ids is None and self._apps_snapshot is not None:
+            return self._apps_snapshot
+
         apps = []
-        for app in running_apps:
-            if not app.isHidden():
+        with objc.autorelease_pool():
+            onscreen_pids = self.get_onscreen_pids()
+            for app in _RUNNING():
+                # Filter on the bundle id first, so unwanted apps cost a single ObjC call
+                bundle_id = app.bundleIdentifier()
+                if wanted_bundle_ids is not None and bundle_id not in wanted_bundle_ids:
+                    continue
+                if app.isHidden():
+                    continue
+                name = app.localizedName()
+                pid = int(app.processIdentifier())
                 apps.append({
-                    'name': app.localizedName(),
-                    'bundle_id': app.bundleIdentifier(),
-                    'pid': app.processIdentifier()
+                    'name': str(name) if name is not None else None,
+                    'bundle_id': str(bundle_id) if bundle_id is not None else None,
+                    'pid': pid,
+                    'has_window': pid in onscreen_pids
                 })
         
+        if wanted_bundle_ids is None:
+            self._apps_snapshot = apps
         return apps
 
+    def get_onscreen_pids(self):
+        """Get PIDs owning at least one on-screen window (one CoreGraphics call, no AX)"""
+        window_info = CGWindowListCopyWindowInfo(kCGWindowListOptionOnScreenOnly, kCGNullWindowID) or []
+        return {int(info['kCGWindowOwnerPID']) for info in window_info if 'kCGWindowOwnerPID' in info}
+
     def check_accessibility_permissions(self):
-        """Check if accessibility permissions are granted"""
-        return AXIsProcessTrusted()
+        """Check if accessibility permissions are granted (cached; trust can't change mid-process)"""
+        if self._trusted is None:
+            self._trusted = bool(AXIsProcessTrusted())
+        return self._trusted
+
+    def _get_app_ref(self, pid):
+        """Get the AX application element for a PID, reusing it within AX_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._ax_app_cache.get(pid)
+        if cached and now - cached[0] < AX_CACHE_TTL:
+            return cached[1]
+
+        app_ref = AXUIElementCreateApplication(pid)
+        self._ax_app_cache[pid] = (now, app_ref)
+        return app_ref
+
+    def invalidate(self, pid):
+        """Drop cached AX state for a PID (e.g. after an AX error or app termination)"""
+        self._ax_app_cache.pop(pid, None)
+        self._windows_cache.pop(pid, None)
+        self._win_size_cache.pop(pid, None)
 
     def get_app_windows(self, pid):
-        """Get all windows for an application"""
+        """Get all windows for an application, reusing the list within AX_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._windows_cache.get(pid)
+        if cached and now - cached[0] < AX_CACHE_TTL:
+            return cached[1]
+
         try:
-            app_ref = AXUIElementCreateApplication(pid)
+            app_ref = self._get_app_ref(pid)
             error_code, windows_attr = AXUIElementCopyAttributeValue(app_ref, kAXWindowsAttribute, None)
-            return windows_attr if error_code == 0 and windows_attr else []
+            if error_code != 0 or not windows_attr:
+                return []
+            self._windows_cache[pid] = (now, windows_attr)
+            return windows_attr
         except Exception as e:
             print(f"Error getting windows for PID {pid}: {e}")
             return []
 
+    def _get_window_pos_size(self, window):
+        """Read position and size of a window in a single AX round-trip"""
+        error_code, values = AXUIElementCopyMultipleAttributeValues(window, _POS_SIZE_ATTRS, 0, None)
+        if error_code != 0 or not values or len(values) != 2:
+            return None
+
+        ok, position = AXValueGetValue(values[0], kAXValueCGPointType, None)
+        if not ok:
+            return None
+        ok, size = AXValueGetValue(values[1], kAXValueCGSizeType, None)
+        if not ok:
+            return None
+
+        return Rect(int(position.x), int(position.y), int(size.width), int(size.height))
+
+    def _wait_raised(self, window, max_ms=50, step_ms=10):
+        """Poll until the window reports itself as main after a raise, up to max_ms"""
+        deadline = time.monotonic() + max_ms / 1000
+        while True:
+            error_code, is_main = AXUIElementCopyAttributeValue(window, kAXMainAttribute, None)
+            if error_code == 0 and is_main:
+                return True
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(step_ms / 1000)
+
+    def _wait_position_near(self, window, target, tol, max_ms=150, step_ms=10):
+        """Poll the window frame until it is within tol px of target; returns the last frame read"""
+        deadline = time.monotonic() + max_ms / 1000
+        while True:
+            frame = self._get_window_pos_size(window)
+            if frame and frame.is_near(target[0], target[1], tol):
+                return frame
+            if time.monotonic() >= deadline:
+                return frame
+            time.sleep(step_ms / 1000)
+
+    def _set_position_awaiting_move(self, window, pid, position_value, max_ms=150):
+        """Set a window's position and wait up to max_ms for its kAXMovedNotification
+
+        Returns the AX result code of the set. Falls back to not waiting if no observer can be created.
+        """
+        observer = None
+        try:
+            error_code, observer = AXObserverCreate(pid, _on_ax_notification, None)
+            if error_code != 0 or AXObserverAddNotification(observer, window, kAXMovedNotification, None) != 0:
+                observer = None
+        except Exception:
+            observer = None
+        
+        if observer is None:
+            return AXUIElementSetAttributeValue(window, kAXPositionAttribute, position_value)
+        
+        # Run loops are per thread, so this is safe inside move_application_windows_batch workers
+        run_loop = CFRunLoopGetCurrent()
+        source = AXObserverGetRunLoopSource(observer)
+        CFRunLoopAddSource(run_loop, source, kCFRunLoopDefaultMode)
+        try:
+            result = AXUIElementSetAttributeValue(window, kAXPositionAttribute, position_value)
+            if result == 0 and CFRunLoopRunInMode(kCFRunLoopDefaultMode, max_ms / 1000, True) != kCFRunLoopRunHandledSource:
+                if self.verbose:
+                    self.print_verbose(f"No move notification from PID {pid} within {max_ms}ms")
+            return result
+        finally:
+            CFRunLoopRemoveSource(run_loop, source, kCFRunLoopDefaultMode)
+            AXObserverRemoveNotification(observer, window, kAXMovedNotification)
+
+    def last_target(self, pid):
+        """Corner-aligned position the PID's window was last moved to, if any"""
+        return self._last_targets.get(pid)
+
     def get_window_position(self, pid):
         """Get current position and size of application window"""
         try:
@@ -69,102 +225,61 @@ class ApplicationManager:
             if not windows:
                 return None
             
-            window = windows[0]
-            
-            error_code, position_value = AXUIElementCopyAttributeValue(window, kAXPositionAttribute, None)
-            if error_code != 0:
-                return None
-                
-            error_code, size_value = AXUIElementCopyAttributeValue(window, kAXSizeAttribute, None)
-            if error_code != 0:
-                return None
-            
-            position = AXValueGetValue(position_value, kAXValueCGPointType, None)[1]
-            size = AXValueGetValue(size_value, kAXValueCGSizeType, None)[1]
-            
-            return {
-                'x': int(position.x),
-                'y': int(position.y),
-                'width': int(size.width),
-                'height': int(size.height)
-            }
+            frame = self._get_window_pos_size(windows[0])
+            if frame:
+                # The batched read returns the size too, so keep it for get_window_size
+                self._win_size_cache[pid] = (time.monotonic(), Size(frame.width, frame.height))
+            else:
+                # The cached window may have closed (kAXErrorInvalidUIElement)
+                self.invalidate(pid)
+            return frame
             
         except Exception as e:
             print(f"Error getting window position for PID {pid}: {e}")
             return None
 
     def get_window_size(self, pid):
-        """Get window size for the specified PID"""
-        try:
-            app = AXUIElementCreateApplication(pid)
-            error_code, windows = AXUIElementCopyAttributeValue(app, kAXWindowsAttribute, None)
-            
-            if error_code == 0 and windows:
-                window = windows[0]
-                error_code, size_value = AXUIElementCopyAttributeValue(window, kAXSizeAttribute, None)
-                if error_code == 0:
-                    size = AXValueGetValue(size_value, kAXValueCGSizeType, None)[1]
-                    return {'width': int(size.width), 'height': int(size.height)}
-            
-        except Exception as e:
-            print(f"Error getting window size for PID {pid}: {e}")
-        
-        return None
+        """Get window size for the specified PID (read together with the position)"""
+        cached = self._win_size_cache.get(pid)
+        if cached and time.monotonic() - cached[0] < AX_CACHE_TTL:
+            return cached[1]
+
+        frame = self.get_window_position(pid)
+        return Size(frame.width, frame.height) if frame else None
+
+    def prefetch_window_sizes(self, pids, max_workers=4):
+        """Fetch window sizes for several PIDs concurrently; returns {pid: size or None}"""
+        pids = list(dict.fromkeys(pids))
+        if not pids:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pids))) as executor:
+            return dict(zip(pids, executor.map(self.get_window_size, pids)))
 
     def calculate_corner_aligned_position(self, quadrant_position, window_size, quadrant):
         """Calculate corner-aligned position based on quadrant and window size"""
         if not window_size:
             return quadrant_position
         
-        x = quadrant_position['x']
-        y = quadrant_position['y'] 
-        quad_width = quadrant_position['width']
-        quad_height = quadrant_position['height']
-        
-        if quadrant == 'top_left':
-            aligned_x, aligned_y = x, y
-        elif quadrant == 'top_right':
-            aligned_x = x + quad_width - window_size['width']
-            aligned_y = y
-        elif quadrant == 'bottom_left':
-            aligned_x = x
-            aligned_y = y + quad_height - window_size['height']
-        elif quadrant == 'bottom_right':
-            aligned_x = x + quad_width - window_size['width'] 
-            aligned_y = y + quad_height - window_size['height']
-        else:
-            aligned_x, aligned_y = x, y
-            
-        return {'x': aligned_x, 'y': aligned_y}
+        return self._align_to_corner(quadrant_position, window_size.width, window_size.height, quadrant)
 
     def calculate_simple_corner_alignment(self, quadrant_position, quadrant):
         """Simple corner alignment using estimated small window sizes"""
-        x = quadrant_position['x']
-        y = quadrant_position['y'] 
-        quad_width = quadrant_position['width']
-        quad_height = quadrant_position['height']
-        
         estimated_small_width = 300
         estimated_small_height = 400
         
-        if quadrant == 'top_left':
-            aligned_x, aligned_y = x, y
-        elif quadrant == 'top_right':
-            aligned_x = x + quad_width - estimated_small_width
-            aligned_y = y
-        elif quadrant == 'bottom_left':
-            aligned_x = x
-            aligned_y = y + quad_height - estimated_small_height
-        elif quadrant == 'bottom_right':
-            aligned_x = x + quad_width - estimated_small_width
-            aligned_y = y + quad_height - estimated_small_height
-        else:
-            aligned_x, aligned_y = x, y
-            
-        return {'x': aligned_x, 'y': aligned_y}
+        return self._align_to_corner(quadrant_position, estimated_small_width, estimated_small_height, quadrant)
+
+    def _align_to_corner(self, quadrant_position, window_width, window_height, quadrant):
+        """Push a window of the given size into the quadrant's named corner"""
+        return _corner_aligned_rect(quadrant, quadrant_position.x, quadrant_position.y,
+                                    quadrant_position.width, quadrant_position.height,
+                                    window_width, window_height)
+
+    def move_application_window(self, pid, position, app_bundle_id=None, app_name=None, quadrant=None, positioning_strategy=None, window_size=None):
+        """Move application window to specified position using accessibility APIs
 
-    def move_application_window(self, pid, position, app_bundle_id=None, app_name=None, quadrant=None, positioning_strategy=None):
-        """Move application window to specified position using accessibility APIs"""
+        window_size may be passed in (e.g. from prefetch_window_sizes) to skip the size read.
+        """
         if not self.check_accessibility_permissions():
             print("❌ Accessibility permissions not granted!")
             print("Please grant accessibility permissions:")
@@ -179,25 +294,36 @@ class ApplicationManager:
                 return False
             
             window = windows[0]
-            self.print_verbose(f"Using first window (of {len(windows)} available)")
+            if self.verbose:
+                self.print_verbose(f"Using first window (of {len(windows)} available)")
             
             AXUIElementPerformAction(window, kAXRaiseAction)
-            time.sleep(0.05)
+            self._wait_raised(window)
             
-            window_size = None
-            if quadrant:
-                window_size = self.get_window_size(pid)
-                self.print_verbose(f"DEBUG: Got window size for {quadrant}: {window_size}")
+            # top_left is already aligned to the quadrant origin, so it needs no window size
+            needs_alignment = quadrant and quadrant != 'top_left'
             
-            if quadrant and window_size:
-                aligned_position = self.calculate_corner_aligned_position(position, window_size, quadrant)
-                self.print_verbose(f"Corner alignment: {quadrant} adjusted position from ({position['x']}, {position['y']}) to ({aligned_position['x']}, {aligned_position['y']})")
+            if needs_alignment and window_size is None:
+                window_size = self._get_window_pos_size(window)
+                if window_size:
+                    self._win_size_cache[pid] = (time.monotonic(), Size(window_size.width, window_size.height))
+                if self.verbose:
+                    self.print_verbose(f"DEBUG: Got window size for {quadrant}: {window_size}")
+            
+            if not needs_alignment:
+                aligned_position = position
             else:
-                if quadrant:
-                    aligned_position = self.calculate_simple_corner_alignment(position, quadrant)
-                    self.print_verbose(f"Fallback corner alignment: {quadrant} adjusted position from ({position['x']}, {position['y']}) to ({aligned_position['x']}, {aligned_position['y']})")
+                if window_size:
+                    aligned_position = self.calculate_corner_aligned_position(position, window_size, quadrant)
+                    label = "Corner alignment"
                 else:
-                    aligned_position = position
+                    aligned_position = self.calculate_simple_corner_alignment(position, quadrant)
+                    label = "Fallback corner alignment"
+                # Debug strings are only built when they will be shown
+                if self.verbose:
+                    self.print_verbose(f"{label}: {quadrant} adjusted position from ({position.x}, {position.y}) to ({aligned_position.x}, {aligned_position.y})")
+            
+            self._last_targets[pid] = aligned_position
             
             if positioning_strategy == 'chrome':
                 return self._move_chrome_window(window, aligned_position, pid, app_name)
@@ -208,15 +334,59 @@ class ApplicationManager:
             print(f"❌ Error positioning window for PID {pid}: {e}")
             return False
 
+    def move_application_windows_batch(self, moves, max_workers=4):
+        """Run several move_application_window calls, concurrently across PIDs
+
+        moves is a list of geometry.PlannedMove. Moves for the same PID run one after another,
+        in order. Returns a list of (success, captured output) in the same order as moves, so
+        callers can print it in order.
+        """
+        if not moves:
+            return []
+        if not self.check_accessibility_permissions():
+            # Report missing permissions once for the whole batch instead of once per app
+            self._move_planned(moves[0])
+            return [(False, "")] * len(moves)
+        
+        results = [None] * len(moves)
+        
+        def move_group(indices):
+            for i in indices:
+                with objc.autorelease_pool():
+                    results[i] = run_captured(self._move_planned, moves[i])
+        
+        # Two workers must never move the same window, so each PID's moves form one group
+        groups = {}
+        for i, planned in enumerate(moves):
+            groups.setdefault(planned.pid, []).append(i)
+        # Chrome windows wait on their own move notification, so their groups run alone after the pool
+        chrome = [g for g in groups.values() if any(moves[i].positioning_strategy == 'chrome' for i in g)]
+        parallel = [g for g in groups.values() if g not in chrome]
+        with routed_stdout():
+            if parallel:
+                with ThreadPoolExecutor(max_workers=min(max_workers, len(parallel))) as executor:
+                    list(executor.map(move_group, parallel))
+            for group in chrome:
+                move_group(group)
+        return results
+
+    def _move_planned(self, planned):
+        """Run move_application_window for a geometry.PlannedMove"""
+        return self.move_application_window(
+            planned.pid, planned.position,
+            app_bundle_id=planned.bundle_id, app_name=planned.name, quadrant=planned.quadrant,
+            positioning_strategy=planned.positioning_strategy, window_size=planned.window_size
+        )
+
     def _move_standard_window(self, window, aligned_position, pid, app_name=None):
         """Standard window positioning for most applications"""
-        new_position = (float(aligned_position['x']), float(aligned_position['y']))
+        new_position = (float(aligned_position.x), float(aligned_position.y))
         position_value = AXValueCreate(kAXValueCGPointType, new_position)
         
         if app_name:
             print(f"Positioning {app_name}...")
         else:
-            print(f"Attempting to move window to final position: ({aligned_position['x']}, {aligned_position['y']})")
+            print(f"Attempting to move window to final position: ({aligned_position.x}, {aligned_position.y})")
         
         pos_result = AXUIElementSetAttributeValue(window, kAXPositionAttribute, position_value)
         
@@ -229,69 +399,74 @@ class ApplicationManager:
             return True
         else:
             print(f"❌ Position command rejected for PID {pid} (code: {pos_result})")
+            self.invalidate(pid)
             return False
 
     def _move_chrome_window(self, window, aligned_position, pid, app_name=None):
-        """Chrome-specific positioning with multiple strategies"""
-        target_x, target_y = float(aligned_position['x']), float(aligned_position['y'])
-        target_width, target_height = 0, 0
+        """Chrome-specific positioning: set the position once, then verify it landed within 25px"""
+        target_x, target_y = float(aligned_position.x), float(aligned_position.y)
         
         if app_name:
             print(f"Positioning {app_name}...")
         
-        self.print_verbose(f"🔄 Chrome detected - using multi-attempt positioning strategy")
-        self.print_verbose(f"Target: ({target_x}, {target_y}) {target_width}x{target_height}")
+        if self.verbose:
+            self.print_verbose("🔄 Chrome detected - setting position and verifying the result")
+            self.print_verbose(f"Target: ({target_x}, {target_y})")
         
-        self.print_verbose("Strategy 1: Direct positioning")
+        # Single-shot: the value is created once and there is no retry with adjusted coordinates
         position_value = AXValueCreate(kAXValueCGPointType, (target_x, target_y))
-        pos_result = AXUIElementSetAttributeValue(window, kAXPositionAttribute, position_value)
+        pos_result = self._set_position_awaiting_move(window, pid, position_value)
         
-        if pos_result == 0:
-            time.sleep(0.1)
-            actual_pos = self.get_window_position(pid)
-            if actual_pos:
-                x_diff = abs(actual_pos['x'] - target_x)
-                y_diff = abs(actual_pos['y'] - target_y)
-                if x_diff <= 25 and y_diff <= 25:
-                    if app_name:
-                        print(f"✅ {app_name} positioned successfully")
-                    self.print_verbose(f"✅ Chrome positioned successfully with {x_diff}px/{y_diff}px offset")
-                    return True
-                else:
-                    self.print_verbose(f"⚠️  Chrome offset detected: actual ({actual_pos['x']}, {actual_pos['y']}) vs target ({target_x}, {target_y})")
+        if pos_result != 0:
+            if self.verbose:
+                self.print_verbose(f"❌ Position command rejected for PID {pid} (code: {pos_result})")
+            self.invalidate(pid)
+            return False
         
-        print("Strategy 2: Skipped - direct positioning should work with correct coordinates")
+        actual_pos = self._wait_position_near(window, (target_x, target_y), 25)
+        if not actual_pos:
+            return False
+        
+        if actual_pos.is_near(target_x, target_y, 25):
+            if app_name:
+                print(f"✅ {app_name} positioned successfully")
+            if self.verbose:
+                self.print_verbose(f"✅ Chrome positioned successfully with {abs(actual_pos.x - target_x)}px/{abs(actual_pos.y - target_y)}px offset")
+            return True
         
-        print("Strategy 3: Coordinate adjustment for Chrome offset pattern")
-        print("⚠️  Strategy 3 disabled - hardcoded offsets were incorrect")
+        if self.verbose:
+            self.print_verbose(f"⚠️  Chrome offset detected: actual ({actual_pos.x}, {actual_pos.y}) vs target ({target_x}, {target_y})")
         return False
 
-    def validate_positioning_with_pyautogui(self, target_x, target_y):
-        """Validate positioning coordinates using pyautogui mouse positioning"""
-        if not PYAUTOGUI_AVAILABLE:
-            return None
+    def validate_positioning_with_pyautogui(self, target_x, target_y, pid=None):
+        """Validate that a PID's window landed on the target, via an AX frame read
+
+        Kept under its old name for compatibility; the mouse is no longer moved.
+        Without a pid, only checks that the target point lies on some display.
+        """
+        if pid is None:
+            error_code, _, display_count = CGGetDisplaysWithPoint((target_x, target_y), 1, None, None)
+            return {
+                'target': (target_x, target_y),
+                'precise': error_code == 0 and display_count > 0
+            }
         
         try:
-            original_pos = pyautogui.position()
-            
-            pyautogui.moveTo(target_x, target_y, duration=0.1)
-            validation_pos = pyautogui.position()
-            
-            pyautogui.moveTo(original_pos.x, original_pos.y, duration=0.1)
-            
-            x_diff = abs(validation_pos.x - target_x)
-            y_diff = abs(validation_pos.y - target_y)
+            windows = self.get_app_windows(pid)
+            frame = self._get_window_pos_size(windows[0]) if windows else None
+            if not frame:
+                return None
             
             return {
                 'target': (target_x, target_y),
-                'actual': (validation_pos.x, validation_pos.y),
-                'x_diff': x_diff,
-                'y_diff': y_diff,
-                'precise': x_diff <= 5 and y_diff <= 5
+                'actual': (frame.x, frame.y),
+                'x_diff': abs(frame.x - target_x),
+                'y_diff': abs(frame.y - target_y),
+                'precise': frame.is_near(target_x, target_y, 5)
             }
             
         except Exception as e:
-            print(f"Error validating coordinates with pyautogui: {e}")
+            print(f"Error validating position for PID {pid}: {e}")
             return None
 
     def list_applications(self):
@@ -1,16 +1,100 @@
 """Configuration loading for Mac App Positioner."""
 
-import yaml
+import functools
+import json
+import os
 import sys
 
+@functools.cache
+def _yaml_loader():
+    """Import yaml on first parse (a fresh JSON sidecar skips it); returns (yaml, Loader)"""
+    import yaml
+    try:
+        from yaml import CSafeLoader as loader
+    except ImportError:
+        from yaml import SafeLoader as loader
+    return yaml, loader
+
+# In-process cache: path -> (st_mtime_ns, st_size, parsed config)
+_CONFIG_CACHE = {}
+
+def _cache_path(config_path):
+    """Return the JSON sidecar path used to cache a parsed config file."""
+    directory, name = os.path.split(config_path)
+    return os.path.join(directory, f".{name}.cache.json")
+
+def _load_cached(cache_path, key):
+    """Return cached config if the sidecar was written for exactly this (st_mtime_ns, st_size), else None."""
+    try:
+        with open(cache_path, 'r') as file:
+            cached = json.load(file)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(cached, dict) or cached.get('stat') != list(key):
+        return None
+    return cached.get('data')
+
+def _remove_cache(cache_path):
+    """Delete the JSON sidecar if present."""
+    try:
+        os.remove(cache_path)
+    except OSError:
+        pass
+
+def _write_cache(cache_path, key, data):
+    """Write the JSON sidecar; skipped when JSON would not round-trip the data (e.g. non-string keys)."""
+    try:
+        if json.loads(json.dumps(data)) != data:
+            _remove_cache(cache_path)
+            return
+        with open(cache_path, 'w') as file:
+            json.dump({'stat': list(key), 'data': data}, file)
+    except (OSError, TypeError, ValueError):
+        # e.g. a read-only filesystem
+        _remove_cache(cache_path)
+
+def _stat_key(config_path):
+    """Return (st_mtime_ns, st_size) for a file, or None if it cannot be stat'ed."""
+    try:
+        st = os.stat(config_path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+def remember_config(config_path, data):
+    """Record freshly written config data so the next load skips parsing."""
+    key = _stat_key(config_path)
+    if key is None:
+        _CONFIG_CACHE.pop(config_path, None)
+        return
+    _CONFIG_CACHE[config_path] = (*key, data)
+    _write_cache(_cache_path(config_path), key, data)
+
 def load_config(config_path="config.yaml"):
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file, reusing in-process and JSON sidecar caches when fresh."""
+    key = _stat_key(config_path)
+    entry = _CONFIG_CACHE.get(config_path)
+    if key is not None and entry is not None and entry[:2] == key:
+        return entry[2]
+
+    cache_path = _cache_path(config_path)
+    cached = _load_cached(cache_path, key) if key is not None else None
+    if cached is not None:
+        _CONFIG_CACHE[config_path] = (*key, cached)
+        return cached
+
+    yaml, loader = _yaml_loader()
     try:
-        with open(config_path, 'r') as file:
-            return yaml.safe_load(file)
+        with open(config_path, 'rb') as file:
+            data = yaml.load(file, Loader=loader)
     except FileNotFoundError:
         print(f"Configuration file {config_path} not found")
         sys.exit(1)
     except yaml.YAMLError as e:
         print(f"Error parsing configuration file: {e}")
         sys.exit(1)
+
+    if key is not None:
+        _write_cache(cache_path, key, data)
+        _CONFIG_CACHE[config_path] = (*key, data)
+    return data
@@ -1,43 +1,114 @@
 """Display management for Mac App Positioner."""
 
+import functools
+import time
+import types
 from Cocoa import NSScreen
+from .geometry import Screen
+from .output import buffered_stdout
 
-# Enhanced monitor detection
-try:
-    import pymonctl
-    PYMONCTL_AVAILABLE = True
-except ImportError:
-    PYMONCTL_AVAILABLE = False
+@functools.cache
+def _load_pymonctl():
+    """Import pymonctl (enhanced monitor detection) on first use; None if it is not installed"""
+    try:
+        import pymonctl
+    except ImportError:
+        return None
+    return pymonctl
+
+# Seconds get_screens_enhanced and identify_monitor reuse the screen list; monitor hot-plug is rare
+SCREEN_CACHE_TTL = 5.0
 
 class DisplayManager:
+    # Known (width, height) shapes -> name formatter taking the screen index
+    _MONITOR_SHAPES = {
+        (2056, 1329): lambda i: 'Built-in Retina Display_1',
+        (3840, 2160): lambda i: f'4K_Display_{i}',
+        (2560, 1440): lambda i: f'QHD_Display_{i}',
+        (3440, 1440): lambda i: f'UltraWide_Display_{i}',
+    }
+
+    # Known (width, height) shapes -> tag appended by identify_monitor
+    _MONITOR_TAGS = {
+        (2056, 1329): " [Built-in MacBook]",
+        (3840, 2160): " [4K External]",
+        (2560, 1440): " [2560x1440 External]",
+    }
+
+    __slots__ = ('verbose', '_screens_cache', '_rects', '_cache_ts', '_nsscreen_snapshot', '_nsscreen_info', '_coordinate_mappings')
+
     def __init__(self, verbose=False):
         self.verbose = verbose
+        self._screens_cache = None
+        self._rects = None
+        self._cache_ts = 0.0
+        self._nsscreen_snapshot = None
+        self._nsscreen_info = None
+        self._coordinate_mappings = None
         if verbose:
-            if PYMONCTL_AVAILABLE:
+            if _load_pymonctl() is not None:
                 print("✅ pymonctl available - using enhanced monitor detection")
             else:
                 print("⚠️  pymonctl not available - using NSScreen fallback")
-        self.coordinate_mappings = self.generate_dynamic_coordinate_mappings()
+
+    @property
+    def coordinate_mappings(self):
+        """Cocoa-to-Quartz mappings, generated on first use (read-only view)"""
+        if self._coordinate_mappings is None:
+            self._coordinate_mappings = types.MappingProxyType(self.generate_dynamic_coordinate_mappings())
+        return self._coordinate_mappings
 
     def print_verbose(self, message):
         """Print message only if verbose mode is enabled"""
         if self.verbose:
             print(message)
 
+    def _snapshot_nsscreens(self, recheck=False):
+        """Read every NSScreen frame once; returns (screens, main_height)
+
+        With recheck, frames are read again and the mappings and screen list derived from
+        them are dropped only if the layout actually changed.
+        """
+        if self._nsscreen_snapshot is not None and not recheck:
+            return self._nsscreen_snapshot
+        
+        main_screen = NSScreen.mainScreen()
+        screens = []
+        if main_screen is None:
+            # No window server session (e.g. over SSH): report no screens
+            main_height = 0
+            screen_list = ()
+        else:
+            main_height = int(main_screen.frame().size.height)
+            screen_list = NSScreen.screens()
+        
+        for screen in screen_list:
+            frame = screen.frame()
+            screens.append({
+                'x': int(frame.origin.x),
+                'y': int(frame.origin.y),
+                'width': int(frame.size.width),
+                'height': int(frame.size.height),
+                'is_main': screen == main_screen
+            })
+        
+        snapshot = (screens, main_height)
+        if snapshot != self._nsscreen_snapshot:
+            self._nsscreen_info = None
+            self._coordinate_mappings = None
+            self._nsscreen_snapshot = snapshot
+        return self._nsscreen_snapshot
+
     def generate_dynamic_coordinate_mappings(self):
         """Generate coordinate mappings dynamically based on currently connected monitors"""
         try:
-            screens = NSScreen.screens()
+            screens, main_height = self._snapshot_nsscreens()
             mappings = {}
-            main_screen = NSScreen.mainScreen()
-            main_frame = main_screen.frame()
-            main_height = int(main_frame.size.height)
             
             for i, screen in enumerate(screens):
-                frame = screen.frame()
-                cocoa_x, cocoa_y = int(frame.origin.x), int(frame.origin.y)
-                width, height = int(frame.size.width), int(frame.size.height)
-                is_main = screen == main_screen
+                cocoa_x, cocoa_y = screen['x'], screen['y']
+                width, height = screen['width'], screen['height']
+                is_main = screen['is_main']
                 
                 if is_main:
                     quartz_x, quartz_y = 0, 0
@@ -82,20 +153,18 @@ class DisplayManager:
 
     def generate_monitor_name(self, width, height, x, y, index, is_main):
         """Generate a consistent monitor name based on characteristics"""
-        if width == 2056 and height == 1329:
-            return 'Built-in Retina Display_1'
-        elif width == 3840 and height == 2160:
-            return f'4K_Display_{index}'
-        elif width == 2560 and height == 1440:
-            return f'QHD_Display_{index}'
-        elif width == 3440 and height == 1440:
-            return f'UltraWide_Display_{index}'
-        else:
-            return f'Display_{width}x{height}_{index}'
+        fmt = self._MONITOR_SHAPES.get((width, height))
+        return fmt(index) if fmt else f'Display_{width}x{height}_{index}'
 
     def get_screens_enhanced(self):
-        """Enhanced monitor detection using hybrid approach"""
-        if PYMONCTL_AVAILABLE:
+        """Enhanced monitor detection, reusing the last enumeration within SCREEN_CACHE_TTL"""
+        if self._screens_cache is None or time.monotonic() - self._cache_ts > SCREEN_CACHE_TTL:
+            self._refresh_screens()
+        return self._screens_cache
+
+    def _enumerate_screens(self):
+        """Enumerate monitors using hybrid approach (pymonctl, else NSScreen)"""
+        if _load_pymonctl() is not None:
             return self.get_screens_pymonctl()
         else:
             self.print_verbose("Falling back to NSScreen detection")
@@ -104,38 +173,40 @@ class DisplayManager:
     def get_screens_pymonctl(self):
         """Get monitor information using pymonctl (primary method)"""
         try:
-            monitors = pymonctl.getAllMonitors()
+            monitors = _load_pymonctl().getAllMonitors()
+            coordinate_mappings = self.coordinate_mappings
             screen_info = []
             
             for i, monitor in enumerate(monitors):
                 pos = monitor.position
                 size = monitor.size
-                is_main = hasattr(monitor, 'isPrimary') and monitor.isPrimary
+                is_main = bool(getattr(monitor, 'isPrimary', False))
                 
                 monitor_name = self.generate_monitor_name(size.width, size.height, pos.x, pos.y, i, is_main)
                 
-                monitor_info = {
-                    'index': i,
-                    'name': monitor_name,
-                    'original_name': monitor.name,
-                    'width': size.width,
-                    'height': size.height,
-                    'x': pos.x,
-                    'y': pos.y,
-                    'is_main': is_main,
-                    'work_area': getattr(monitor, 'workArea', None),
-                    'source': 'pymonctl'
-                }
-                
-                if monitor_name in self.coordinate_mappings:
-                    mapping = self.coordinate_mappings[monitor_name]
-                    monitor_info['positioning_coords'] = mapping['positioning']
-                    monitor_info['translation_rule'] = mapping['translation_rule']
+                mapping = coordinate_mappings.get(monitor_name)
+                if mapping is not None:
+                    positioning_coords = mapping['positioning']
+                    translation_rule = mapping['translation_rule']
                 else:
-                    monitor_info['positioning_coords'] = (pos.x, pos.y)
-                    monitor_info['translation_rule'] = 'dynamic_fallback'
+                    positioning_coords = (pos.x, pos.y)
+                    translation_rule = 'dynamic_fallback'
                 
-                screen_info.append(monitor_info)
+                screen_info.append(Screen(
+                    index=i,
+                    name=monitor_name,
+                    original_name=monitor.name,
+                    width=size.width,
+                    height=size.height,
+                    resolution=f'{size.width}x{size.height}',
+                    x=pos.x,
+                    y=pos.y,
+                    is_main=is_main,
+                    work_area=getattr(monitor, 'workArea', None),
+                    source='pymonctl',
+                    positioning_coords=positioning_coords,
+                    translation_rule=translation_rule
+                ))
             
             return screen_info
             
@@ -145,111 +216,119 @@ class DisplayManager:
             return self.get_screens_nsscreen()
 
     def get_screens_nsscreen(self):
-        """Fallback monitor detection using NSScreen"""
-        screens = NSScreen.screens()
+        """Fallback monitor detection using NSScreen (built once per snapshot)"""
+        if self._nsscreen_info is not None:
+            return self._nsscreen_info
+        
+        screens, _ = self._snapshot_nsscreens()
         screen_info = []
         
         for i, screen in enumerate(screens):
-            frame = screen.frame()
-            x, y = int(frame.origin.x), int(frame.origin.y)
-            width, height = int(frame.size.width), int(frame.size.height)
-            is_main = screen == NSScreen.mainScreen()
+            x, y = screen['x'], screen['y']
+            width, height = screen['width'], screen['height']
+            is_main = screen['is_main']
             
             monitor_name = self.generate_monitor_name(width, height, x, y, i, is_main)
             
-            screen_info.append({
-                'index': i,
-                'name': monitor_name,
-                'width': width,
-                'height': height,
-                'x': x,
-                'y': y,
-                'is_main': is_main,
-                'positioning_coords': (x, y),
-                'translation_rule': 'nsscreen_dynamic',
-                'source': 'nsscreen'
-            })
+            screen_info.append(Screen(
+                index=i,
+                name=monitor_name,
+                width=width,
+                height=height,
+                resolution=f'{width}x{height}',
+                x=x,
+                y=y,
+                is_main=is_main,
+                positioning_coords=(x, y),
+                translation_rule='nsscreen_dynamic',
+                source='nsscreen'
+            ))
         
+        self._nsscreen_info = screen_info
         return screen_info
 
     def get_screens(self):
         """Get information about connected screens (legacy method for compatibility)"""
         return self.get_screens_nsscreen()
 
+    def _refresh_screens(self):
+        """Re-enumerate screens and rebuild their (left, top, right, bottom) hit-test rects"""
+        self._snapshot_nsscreens(recheck=True)
+        screens = self._enumerate_screens()
+        rects = []
+        for screen in screens:
+            if screen.positioning_coords:
+                screen_x, screen_y = screen.positioning_coords
+            else:
+                screen_x, screen_y = screen.x, screen.y
+            rects.append((screen_x, screen_y, screen_x + screen.width, screen_y + screen.height))
+        
+        self._screens_cache = screens
+        self._rects = rects
+        self._cache_ts = time.monotonic()
+
+    def _describe_match(self, i, screen, screen_x, screen_y):
+        """Build the descriptive string for a screen matched by identify_monitor"""
+        monitor_type = ""
+        if screen.is_main:
+            monitor_type = " (macOS main)"
+            
+        monitor_type += self._MONITOR_TAGS.get((screen.width, screen.height), "")
+        
+        source_info = f"[{screen.source}]" if screen.source else ""
+        name_info = f"({screen.name})" if screen.name else ""
+        return f"Monitor {i} {name_info} {source_info}: {screen.resolution} at ({screen_x}, {screen_y}){monitor_type}"
+
     def identify_monitor(self, x, y, prefer_monitor=None):
         """Identify which monitor a coordinate is on using positioning coordinates"""
         screens = self.get_screens_enhanced()
-        matches = []
+        first_match = None
         
-        for i, screen in enumerate(screens):
-            if 'positioning_coords' in screen and screen['positioning_coords']:
-                screen_x, screen_y = screen['positioning_coords']
-            else:
-                screen_x, screen_y = screen['x'], screen['y']
-                
-            screen_left = screen_x
-            screen_right = screen_x + screen['width']
-            screen_top = screen_y
-            screen_bottom = screen_y + screen['height']
-            
-            if (screen_left <= x < screen_right and 
-                screen_top <= y < screen_bottom):
-                
-                monitor_type = ""
-                if screen['is_main']:
-                    monitor_type = " (macOS main)"
-                    
-                if screen['width'] == 2056 and screen['height'] == 1329:
-                    monitor_type += " [Built-in MacBook]"
-                elif screen['width'] == 3840 and screen['height'] == 2160:
-                    monitor_type += " [4K External]"
-                elif screen['width'] == 2560 and screen['height'] == 1440:
-                    monitor_type += " [2560x1440 External]"
-                
-                source_info = f"[{screen.get('source', 'unknown')}]" if 'source' in screen else ""
-                name_info = f"({screen.get('name', 'Unknown')})" if screen.get('name') else ""
-                match_info = f"Monitor {i} {name_info} {source_info}: {screen['width']}x{screen['height']} at ({screen_x}, {screen_y}){monitor_type}"
-                
-                matches.append((screen, match_info))
-                
-                if prefer_monitor and screen.get('name') == prefer_monitor:
-                    return match_info
+        for i, (left, top, right, bottom) in enumerate(self._rects):
+            if left <= x < right and top <= y < bottom:
+                if first_match is None:
+                    first_match = i
+                if not prefer_monitor or screens[i].name == prefer_monitor:
+                    break
+        else:
+            i = first_match
         
-        if matches:
-            return matches[0][1]
+        if i is None:
+            return "Unknown monitor"
             
-        return "Unknown monitor"
+        return self._describe_match(i, screens[i], self._rects[i][0], self._rects[i][1])
 
     def list_screens(self):
         """List all connected screens with their properties"""
         screens = self.get_screens()
         print("Connected screens (legacy NSScreen):")
         for screen in screens:
-            main_indicator = " (main)" if screen['is_main'] else ""
-            print(f"  Screen {screen['index']}: {screen['width']}x{screen['height']} at ({screen['x']}, {screen['y']}){main_indicator}")
+            main_indicator = " (main)" if screen.is_main else ""
+            print(f"  Screen {screen.index}: {screen.resolution} at ({screen.x}, {screen.y}){main_indicator}")
 
     def list_screens_enhanced(self):
         """List all connected screens with enhanced information"""
-        screens = self.get_screens_enhanced()
-        print("Enhanced monitor detection:")
-        for screen in screens:
-            main_indicator = " (primary)" if screen['is_main'] else ""
-            source_info = f"[{screen.get('source', 'unknown')}]"
-            name_info = f"({screen.get('name', 'Unknown')})" if screen.get('name') else ""
+        with buffered_stdout():
+            screens = self.get_screens_enhanced()
+            print("Enhanced monitor detection:")
+            for screen in screens:
+                main_indicator = " (primary)" if screen.is_main else ""
+                source_info = f"[{screen.source or 'unknown'}]"
+                name_info = f"({screen.name})" if screen.name else ""
             
-            print(f"\n  Monitor {screen['index']} {name_info} {source_info}{main_indicator}")
-            print(f"    Resolution: {screen['width']}x{screen['height']}")
-            print(f"    Arrangement coords: ({screen['x']}, {screen['y']})")
+                print(f"\n  Monitor {screen.index} {name_info} {source_info}{main_indicator}")
+                print(f"    Resolution: {screen.resolution}")
+                print(f"    Arrangement coords: ({screen.x}, {screen.y})")
             
-            if 'positioning_coords' in screen:
-                pos_coords = screen['positioning_coords']
-                translation_rule = screen.get('translation_rule', 'unknown')
-                print(f"    Positioning coords: ({pos_coords[0]}, {pos_coords[1]}) [{translation_rule}]")
+                if screen.positioning_coords:
+                    pos_coords = screen.positioning_coords
+                    translation_rule = screen.translation_rule or 'unknown'
+                    print(f"    Positioning coords: ({pos_coords[0]}, {pos_coords[1]}) [{translation_rule}]")
             
-            if screen.get('work_area'):
-                work_area = screen['work_area']
-                print(f"    Work area: {work_area}")
+                if screen.work_area:
+                    work_area = screen.work_area
+                    print(f"    Work area: {work_area}")
                 
-        print(f"\nCoordinate mappings loaded:")
-        for name, mapping in self.coordinate_mappings.items():
-            print(f"  {name}: {mapping['arrangement']} → {mapping['positioning']} [{mapping['translation_rule']}]")
+            print(f"\nCoordinate mappings loaded:")
+            for name, mapping in self.coordinate_mappings.items():
+                print(f"  {name}: {mapping['arrangement']} → {mapping['positioning']} [{mapping['translation_rule']}]")
@@ -0,0 +1,50 @@
+"""Geometry value types for Mac App Positioner."""
+
+from dataclasses import dataclass
+
+@dataclass(slots=True, frozen=True)
+class Size:
+    """Width and height of a window"""
+    width: int
+    height: int
+
+@dataclass(slots=True, frozen=True)
+class Rect:
+    """A window frame or quadrant in Quartz (top-left origin) coordinates"""
+    x: int
+    y: int
+    width: int
+    height: int
+
+    def is_near(self, x, y, tol):
+        """Whether the origin is within tol px of (x, y) on both axes"""
+        return -tol <= self.x - x <= tol and -tol <= self.y - y <= tol
+
+@dataclass(slots=True, frozen=True)
+class PlannedMove:
+    """One window move planned by ProfileManager for ApplicationManager to carry out"""
+    pid: int
+    position: Rect
+    bundle_id: str
+    name: str
+    quadrant: str
+    positioning_strategy: str = None
+    window_size: Size = None
+
+@dataclass(slots=True)
+class Screen:
+    """A connected display as reported by pymonctl or NSScreen"""
+    index: int
+    name: str
+    width: int
+    height: int
+    resolution: str
+    x: int
+    y: int
+    is_main: bool
+    positioning_coords: tuple
+    translation_rule: str
+    source: str
+    original_name: str = None
+    work_area: object = None
+    is_builtin: bool = None  # memoized by ProfileManager
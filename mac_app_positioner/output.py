@@ -0,0 +1,49 @@
+"""Console output helpers for Mac App Positioner."""
+
+import io
+import sys
+import threading
+from contextlib import contextmanager, redirect_stdout
+
+@contextmanager
+def buffered_stdout():
+    """Collect everything printed inside the block and write it to stdout in one go."""
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
+
+_thread_streams = threading.local()
+
+class _ThreadRoutedStdout:
+    """stdout proxy that sends writes to the calling thread's capture buffer, if it has one."""
+
+    def __init__(self, default):
+        self._default = default
+
+    def write(self, text):
+        stream = getattr(_thread_streams, 'stream', None)
+        return (stream or self._default).write(text)
+
+    def flush(self):
+        stream = getattr(_thread_streams, 'stream', None)
+        (stream or self._default).flush()
+
+@contextmanager
+def routed_stdout():
+    """Let worker threads started inside the block capture their output with run_captured()."""
+    with redirect_stdout(_ThreadRoutedStdout(sys.stdout)):
+        yield
+
+def run_captured(func, *args):
+    """Run func in the current thread, returning (result, everything it printed) (requires routed_stdout)."""
+    buffer = io.StringIO()
+    _thread_streams.stream = buffer
+    try:
+        result = func(*args)
+    finally:
+        _thread_streams.stream = None
+    return result, buffer.getvalue()
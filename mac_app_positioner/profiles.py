@@ -1,7 +1,48 @@
 """Profile management for Mac App Positioner."""
 
+import functools
+import io
+import os
+import shutil
 import time
-import yaml
+from concurrent.futures import ThreadPoolExecutor
+
+from .config import remember_config
+from .geometry import PlannedMove, Rect
+from .output import buffered_stdout
+
+def pack_resolution(width, height):
+    """Pack a width and height into a single int key"""
+    return (width << 16) | height
+
+@functools.cache
+def _yaml_dumper():
+    """Import yaml only when a config is saved; returns (yaml, Dumper)"""
+    import yaml
+    try:
+        from yaml import CSafeDumper as dumper
+    except ImportError:
+        from yaml import SafeDumper as dumper
+    return yaml, dumper
+
+# Static tail of the generate-config suggestion
+_SUGGESTION_FOOTER = "\n# Layout is defined at top level and shared across profiles\n" + "=" * 40
+
+# (quadrant, column, row) of each quadrant within a screen
+_QUAD_OFFSETS = (('top_left', 0, 0), ('top_right', 1, 0), ('bottom_left', 0, 1), ('bottom_right', 1, 1))
+
+def resolution_key(resolution):
+    """Parse a config resolution like "3840x2160" into its packed int key; 'builtin' is returned as-is
+
+    Returns None for a malformed resolution, which then matches no screen.
+    """
+    if resolution == 'builtin':
+        return resolution
+    try:
+        width, height = resolution.split('x')
+        return pack_resolution(int(width), int(height))
+    except (AttributeError, TypeError, ValueError):
+        return None
 
 class ProfileManager:
     def __init__(self, config, display_manager, app_manager, verbose=False):
@@ -9,43 +50,89 @@ class ProfileManager:
         self.display_manager = display_manager
         self.app_manager = app_manager
         self.verbose = verbose
+        if not verbose:
+            # Bind a no-op so quiet runs skip the method call's verbose check entirely
+            self.print_verbose = lambda message: None
+        self._quad_cache = {}
+        self._last_monitors_fp = None
+        self._build_profile_index()
+
+    def _build_profile_index(self):
+        """Precompute each profile's required external resolutions as a bitmask; rerun after config writes
+
+        Profiles requiring more external resolutions are more specific, so they are checked
+        first; ties keep config order. Built-in entries never take part in matching.
+        """
+        self._res_bit = {}
+        masks = {}
+        for name, profile in self.config['profiles'].items():
+            keys = [resolution_key(m.get('resolution')) for m in self._profile_monitors(profile)
+                    if m.get('resolution') != 'builtin']
+            if None in keys:
+                # A malformed resolution can never be connected, so the profile never matches
+                continue
+            mask = 0
+            for key in keys:
+                mask |= 1 << self._res_bit.setdefault(key, len(self._res_bit))
+            masks[name] = mask
+        self._profile_masks = dict(sorted(masks.items(), key=lambda item: -item[1].bit_count()))
+        self._detected = {}  # current screens mask -> matching profile name (or None)
+
+    @staticmethod
+    def _profile_monitors(profile):
+        """A profile's monitors list; empty when the profile or its 'monitors' key is missing"""
+        return (profile or {}).get('monitors') or []
 
     def print_verbose(self, message):
         """Print message only if verbose mode is enabled"""
         if self.verbose:
             print(message)
 
+    def _screen_is_builtin(self, screen, index):
+        """Whether a screen is the built-in display; memoized on the screen dict"""
+        if screen.is_builtin is None:
+            screen.is_builtin = self.display_manager.generate_monitor_name(
+                screen.width, screen.height, screen.x, screen.y, index, screen.is_main
+            ).startswith('Built-in')
+        return screen.is_builtin
+
     def detect_profile(self):
         """Detect which profile matches current monitor configuration"""
         screens = self.display_manager.get_screens()
-        current_resolutions = set(f"{s['width']}x{s['height']}" for s in screens)
-        
-        for profile_name, profile in self.config['profiles'].items():
-            profile_resolutions = set()
-            for monitor in profile['monitors']:
-                if monitor['resolution'] != 'builtin':
-                    profile_resolutions.add(monitor['resolution'])
-            
-            if profile_resolutions.issubset(current_resolutions):
-                return profile_name
+        current_mask = 0
+        for s in screens:
+            bit = self._res_bit.get(pack_resolution(s.width, s.height))
+            if bit is not None:
+                current_mask |= 1 << bit
         
-        return None
+        if current_mask not in self._detected:
+            self._detected[current_mask] = next(
+                (name for name, profile_mask in self._profile_masks.items() if profile_mask & ~current_mask == 0),
+                None
+            )
+        return self._detected[current_mask]
 
     def calculate_quadrant_positions(self, screen):
         """Calculate quadrant positions for a screen using positioning coordinates"""
-        width = screen['width']
-        height = screen['height']
+        width = screen.width
+        height = screen.height
+        cache_key = (width, height, tuple(screen.positioning_coords or ()), screen.x, screen.y)
+        if cache_key in self._quad_cache:
+            return self._quad_cache[cache_key]
         
-        if 'positioning_coords' in screen and screen['positioning_coords']:
-            x_offset, y_offset = screen['positioning_coords']
-            coordinate_source = f"positioning ({screen.get('translation_rule', 'unknown')})"
+        if screen.positioning_coords:
+            x_offset, y_offset = screen.positioning_coords
         else:
-            x_offset = screen['x']
-            y_offset = screen['y']
-            coordinate_source = "arrangement (fallback)"
+            x_offset = screen.x
+            y_offset = screen.y
         
-        self.print_verbose(f"DEBUG: Using {coordinate_source} coordinates: x={x_offset}, y={y_offset}")
-        self.print_verbose(f"DEBUG: Screen bounds: width={width}, height={height}")
+        if self.verbose:
+            if screen.positioning_coords:
+                coordinate_source = f"positioning ({screen.translation_rule or 'unknown'})"
+            else:
+                coordinate_source = "arrangement (fallback)"
+            self.print_verbose(f"DEBUG: Using {coordinate_source} coordinates: x={x_offset}, y={y_offset}")
+            self.print_verbose(f"DEBUG: Screen bounds: width={width}, height={height}")
         
         padding = 0
         usable_width = width - (2 * padding)
@@ -54,37 +141,20 @@ class ProfileManager:
         quad_width = usable_width // 2
         quad_height = usable_height // 2
         
+        x0 = x_offset + padding
+        y0 = y_offset + padding
+        
         positions = {
-            'top_left': {
-                'x': x_offset + padding,
-                'y': y_offset + padding,
-                'width': quad_width,
-                'height': quad_height
-            },
-            'top_right': {
-                'x': x_offset + padding + quad_width,
-                'y': y_offset + padding,
-                'width': quad_width,
-                'height': quad_height
-            },
-            'bottom_left': {
-                'x': x_offset + padding,
-                'y': y_offset + padding + quad_height,
-                'width': quad_width,
-                'height': quad_height
-            },
-            'bottom_right': {
-                'x': x_offset + padding + quad_width,
-                'y': y_offset + padding + quad_height,
-                'width': quad_width,
-                'height': quad_height
-            }
+            name: Rect(x0 + dx * quad_width, y0 + dy * quad_height, quad_width, quad_height)
+            for name, dx, dy in _QUAD_OFFSETS
         }
         
-        self.print_verbose("DEBUG: Calculated positions:")
-        for name, pos in positions.items():
-            self.print_verbose(f"  {name}: ({pos['x']}, {pos['y']}) -> ends at ({pos['x'] + pos['width']}, {pos['y'] + pos['height']})")
-            
+        if self.verbose:
+            self.print_verbose("DEBUG: Calculated positions:")
+            for name, pos in positions.items():
+                self.print_verbose(f"  {name}: ({pos.x}, {pos.y}) -> ends at ({pos.x + pos.width}, {pos.y + pos.height})")
+        
+        self._quad_cache[cache_key] = positions
         return positions
 
     def position_applications(self, profile_name=None):
@@ -101,106 +171,197 @@ class ProfileManager:
         
         start_time = time.time()
         
-        screens = self.display_manager.get_screens_enhanced()
-        
-        for monitor_layout in ['primary', 'builtin']:
-            if monitor_layout in self.config['layout']:
-                self._position_apps_on_monitor(profile, screens, monitor_layout)
+        # Per-app status lines are written in one batch once positioning is done
+        with buffered_stdout():
+            # NSScreen must stay on the main thread, but the running-apps snapshot
+            # (NSRunningApplication + CGWindowList, both thread-safe) can overlap with it
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                wanted = {bundle_id for layout in self.config['layout'].values()
+                          if isinstance(layout, dict) for bundle_id in layout.values()}
+                running_apps_future = executor.submit(self.app_manager.get_running_applications, wanted_bundle_ids=wanted)
+                screens = self.display_manager.get_screens_enhanced()
+                # The verbose readback's identify_monitor calls reuse this (cached) enumeration
+                screen_index = self._index_screens(screens)
+                running_apps = running_apps_future.result()
+            running_by_bid = {app['bundle_id']: app for app in running_apps}
+            
+            for monitor_layout in ['primary', 'builtin']:
+                if monitor_layout in self.config['layout']:
+                    self._position_apps_on_monitor(profile, screen_index, monitor_layout, running_by_bid)
 
-        total_time = time.time() - start_time
-        print(f"Finished positioning in {total_time:.2f} seconds")
+            total_time = time.time() - start_time
+            print(f"Finished positioning in {total_time:.2f} seconds")
         return True
 
-    def _position_apps_on_monitor(self, profile, screens, monitor_position):
-        monitor_config = next((m for m in profile['monitors'] if m['position'] == monitor_position), None)
+    def _index_screens(self, screens):
+        """Map packed resolution keys (first screen wins) and 'builtin' to screens"""
+        screen_index = {}
+        for s in screens:
+            screen_index.setdefault(pack_resolution(s.width, s.height), s)
+            if 'builtin' not in screen_index and self._screen_is_builtin(s, s.index):
+                screen_index['builtin'] = s
+        return screen_index
+
+    def _position_apps_on_monitor(self, profile, screen_index, monitor_position, running_by_bid):
+        monitor_config = next((m for m in self._profile_monitors(profile) if m.get('position') == monitor_position), None)
         if not monitor_config:
             return
 
         monitor_resolution = monitor_config['resolution']
-        
-        if monitor_resolution == 'builtin':
-            target_screen = next((s for s in screens if self.display_manager.generate_monitor_name(s['width'], s['height'], s['x'], s['y'], s['index'], s['is_main']).startswith('Built-in')), None)
-        else:
-            target_screen = next((s for s in screens if f"{s['width']}x{s['height']}" == monitor_resolution), None)
+        key = resolution_key(monitor_resolution)
+        target_screen = screen_index.get(key) if key is not None else None
 
         if not target_screen:
             print(f"Could not find screen for position {monitor_position} with resolution {monitor_resolution}")
             return
 
-        print(f"Positioning applications on {monitor_position} monitor ({target_screen['width']}x{target_screen['height']})")
+        print(f"Positioning applications on {monitor_position} monitor ({target_screen.resolution})")
         quadrants = self.calculate_quadrant_positions(target_screen)
-        running_apps = self.app_manager.get_running_applications()
         layout = self.config['layout'][monitor_position]
 
         if isinstance(layout, dict):
-            for quadrant, bundle_id in layout.items():
-                self._position_app(bundle_id, running_apps, quadrants[quadrant], quadrant, target_screen)
+            # Window sizes for corner alignment are fetched up front, concurrently
+            aligned_bundle_ids = {bundle_id for quadrant, bundle_id in layout.items() if quadrant != 'top_left'}
+            aligned_apps = (running_by_bid.get(bundle_id) for bundle_id in aligned_bundle_ids)
+            pids = [app['pid'] for app in aligned_apps if app and app.get('has_window', True)]
+            window_sizes = self.app_manager.prefetch_window_sizes(pids)
+            
+            # All moves go to the app manager as one batch; output is printed in layout order
+            plans = [self._plan_move(bundle_id, running_by_bid, quadrants[quadrant], quadrant, window_sizes)
+                     for quadrant, bundle_id in layout.items()]
+            results = iter(self.app_manager.move_application_windows_batch([move for move, _ in plans if move]))
+            for move, skip_message in plans:
+                if move is None:
+                    print(skip_message)
+                    continue
+                moved, output = next(results)
+                print(output, end="")
+                self._report_move(move, moved, target_screen)
         elif isinstance(layout, list):
             # For now, we don't have a specific layout for lists of apps, so we'll just print a message
             for bundle_id in layout:
                 print(f"Skipping {bundle_id} on {monitor_position} monitor for now.")
 
-    def _position_app(self, bundle_id, running_apps, position, quadrant, screen):
-        target_app = next((app for app in running_apps if app['bundle_id'] == bundle_id), None)
+    def _plan_move(self, bundle_id, running_by_bid, position, quadrant, window_sizes=None):
+        """Return (PlannedMove, None) for an app, or (None, skip message)"""
+        target_app = running_by_bid.get(bundle_id)
         if not target_app:
-            print(f"Application {bundle_id} not found or not running")
-            return
+            return None, f"Application {bundle_id} not found or not running"
+        if not target_app.get('has_window', True):
+            return None, f"Application {bundle_id} has no on-screen windows"
 
         app_config = self.config.get('applications', {}).get(bundle_id, {})
         positioning_strategy = app_config.get('positioning_strategy')
 
-        if self.app_manager.move_application_window(target_app['pid'], position, bundle_id, target_app['name'], quadrant, positioning_strategy):
-            time.sleep(0.1)
-            final_pos = self.app_manager.get_window_position(target_app['pid'])
+        window_size = (window_sizes or {}).get(target_app['pid'])
+        return PlannedMove(target_app['pid'], position, bundle_id, target_app['name'], quadrant,
+                           positioning_strategy, window_size), None
+
+    def _report_move(self, move, moved, screen):
+        """Print the outcome of a planned move"""
+        pid, name = move.pid, move.name
+        if not moved:
+            print(f"Failed to position {name}")
+        # The readback only feeds verbose output, so skip it entirely otherwise
+        elif self.verbose:
+            final_pos = self._wait_for_move(pid, self.app_manager.last_target(pid))
             if final_pos:
-                self.print_verbose(f"Actual: {target_app['name']} ended up at ({final_pos['x']}, {final_pos['y']}) -> {quadrant}")
-                monitor_info = self.display_manager.identify_monitor(final_pos['x'], final_pos['y'], screen.get('name'))
+                self.print_verbose(f"Actual: {name} ended up at ({final_pos.x}, {final_pos.y}) -> {move.quadrant}")
+                monitor_info = self.display_manager.identify_monitor(final_pos.x, final_pos.y, screen.name)
                 self.print_verbose(f"        Window is on: {monitor_info}")
-        else:
-            print(f"Failed to position {target_app['name']}")
 
-    def generate_profile_config(self, profile_name):
-        """Generate profile config based on current screen setup"""
-        screens = self.display_manager.get_screens()
-        
-        print(f"Generating config for profile: {profile_name}")
-        print("Current screen setup:")
+    def _wait_for_move(self, pid, expected, deadline_ms=100, initial_ms=5):
+        """Read back a window's frame, polling with backoff until it is within 2px of expected"""
+        deadline = time.monotonic() + deadline_ms / 1000
+        delay_ms = initial_ms
+        while True:
+            pos = self.app_manager.get_window_position(pid)
+            if expected is None or (pos and pos.is_near(expected.x, expected.y, 2)):
+                return pos
+            if time.monotonic() >= deadline:
+                return pos
+            time.sleep(delay_ms / 1000)
+            delay_ms = min(delay_ms * 2, 20)
+
+    def _build_config_monitors(self, screens):
+        """Build the profile 'monitors' list for a screen setup; reused while the setup is unchanged"""
+        fingerprint = tuple((s.width, s.height, s.x, s.y, s.is_main) for s in screens)
+        if self._last_monitors_fp is not None and self._last_monitors_fp[0] == fingerprint:
+            return self._last_monitors_fp[1]
         
         config_monitors = []
         for i, screen in enumerate(screens):
-            resolution = f"{screen['width']}x{screen['height']}"
-            main_indicator = " (main)" if screen['is_main'] else ""
-            print(f"  Screen {i}: {resolution} at ({screen['x']}, {screen['y']}){main_indicator}")
-            
-            if self.display_manager.generate_monitor_name(screen['width'], screen['height'], screen['x'], screen['y'], i, screen['is_main']).startswith('Built-in'):
+            resolution = screen.resolution
+            if self._screen_is_builtin(screen, i):
                 config_monitors.append({
                     'resolution': 'builtin',
                     'position': 'builtin'
                 })
-            elif screen['is_main']:
+            elif screen.is_main:
                 config_monitors.append({
                     'resolution': resolution,
                     'position': 'primary'
                 })
             elif i == 1:
-                position = 'left' if screen['x'] < 0 else 'right'
+                position = 'left' if screen.x < 0 else 'right'
                 config_monitors.append({
                     'resolution': resolution,
                     'position': position
                 })
         
-        print(f"\nSuggested config for {profile_name} profile:")
-        print("=" * 40)
-        print(f"{profile_name}:")
-        print("  monitors:")
-        for monitor in config_monitors:
-            print(f"    - resolution: \"{monitor['resolution']}\"")
-            print(f"      position: \"{monitor['position']}\"")
-        print("\n# Layout is defined at top level and shared across profiles")
-        print("=" * 40)
+        self._last_monitors_fp = (fingerprint, config_monitors)
+        return config_monitors
+
+    def generate_profile_config(self, profile_name):
+        """Generate profile config based on current screen setup"""
+        screens = self.display_manager.get_screens()
+        
+        # The whole suggestion is written to stdout in one go
+        with buffered_stdout():
+            print(f"Generating config for profile: {profile_name}")
+            print("Current screen setup:")
+            
+            for i, screen in enumerate(screens):
+                main_indicator = " (main)" if screen.is_main else ""
+                print(f"  Screen {i}: {screen.resolution} at ({screen.x}, {screen.y}){main_indicator}")
+            
+            config_monitors = self._build_config_monitors(screens)
+            
+            print(f"\nSuggested config for {profile_name} profile:")
+            print("=" * 40)
+            print(f"{profile_name}:")
+            print("  monitors:")
+            for monitor in config_monitors:
+                print(f"    - resolution: \"{monitor['resolution']}\"")
+                print(f"      position: \"{monitor['position']}\"")
+            print(_SUGGESTION_FOOTER)
         
         return config_monitors
 
+    def _save_config(self, config_path):
+        """Write self.config atomically (one write to a temp file, then os.replace)
+
+        A symlinked config is written through to its target, and the file's mode is kept.
+        """
+        buffer = io.StringIO()
+        yaml, dumper = _yaml_dumper()
+        yaml.dump(self.config, buffer, Dumper=dumper, default_flow_style=False, sort_keys=False)
+        real_path = os.path.realpath(config_path)
+        tmp_path = real_path + '.tmp'
+        with open(tmp_path, 'w') as file:
+            file.write(buffer.getvalue())
+        try:
+            shutil.copymode(real_path, tmp_path)
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_path, real_path)
+        remember_config(config_path, self.config)
+        self._build_profile_index()
+
+    def _monitors_unchanged(self, profile_name, config_monitors):
+        """Whether a profile already has exactly these monitors (so saving can be skipped)"""
+        return (self.config['profiles'].get(profile_name) or {}).get('monitors') == config_monitors
+
     def update_profile_interactive(self, profile_name, config_path="config.yaml"):
         """Interactively update a profile with current screen setup"""
         if profile_name not in self.config['profiles']:
@@ -210,15 +371,16 @@ class ProfileManager:
                 return
         
         config_monitors = self.generate_profile_config(profile_name)
+        if self._monitors_unchanged(profile_name, config_monitors):
+            print(f"\nProfile '{profile_name}' already matches the current setup; config not rewritten.")
+            return
         
         update = input(f"\nUpdate '{profile_name}' profile with this configuration? (y/N): ").lower().strip()
         if update == 'y':
-            self.config['profiles'][profile_name]['monitors'] = []
-            for monitor in config_monitors:
-                self.config['profiles'][profile_name]['monitors'].append(monitor)
+            # setdefault covers the "create new profile" path, which has no entry yet
+            self.config['profiles'].setdefault(profile_name, {})['monitors'] = list(config_monitors)
             
-            with open(config_path, 'w') as file:
-                yaml.dump(self.config, file, default_flow_style=False, sort_keys=False)
+            self._save_config(config_path)
             
             print(f"✅ Profile '{profile_name}' updated successfully!")
             print(f"Config saved to {config_path}")
@@ -227,36 +389,14 @@ class ProfileManager:
 
     def quick_update_profile(self, profile_name, config_path="config.yaml"):
         """Quickly update profile with current setup (no confirmation)"""
-        config_monitors = []
         screens = self.display_manager.get_screens()
+        config_monitors = self._build_config_monitors(screens)
+        if self._monitors_unchanged(profile_name, config_monitors):
+            print(f"✅ Profile '{profile_name}' already matches the current screen setup; config not rewritten.")
+            return
         
-        for i, screen in enumerate(screens):
-            resolution = f"{screen['width']}x{screen['height']}"
-            if self.display_manager.generate_monitor_name(screen['width'], screen['height'], screen['x'], screen['y'], i, screen['is_main']).startswith('Built-in'):
-                config_monitors.append({
-                    'resolution': 'builtin',
-                    'position': 'builtin'
-                })
-            elif screen['is_main']:
-                config_monitors.append({
-                    'resolution': resolution,
-                    'position': 'primary'
-                })
-            elif i == 1:
-                position = 'left' if screen['x'] < 0 else 'right'
-                config_monitors.append({
-                    'resolution': resolution,
-                    'position': position
-                })
-        
-        if profile_name not in self.config['profiles']:
-            self.config['profiles'][profile_name] = {
-                'monitors': config_monitors
-            }
-        else:
-            self.config['profiles'][profile_name]['monitors'] = config_monitors
+        self.config['profiles'].setdefault(profile_name, {})['monitors'] = list(config_monitors)
         
-        with open(config_path, 'w') as file:
-            yaml.dump(self.config, file, default_flow_style=False, sort_keys=False)
+        self._save_config(config_path)
         
         print(f"✅ Profile '{profile_name}' updated with current screen setup!")
\ No newline at end of file
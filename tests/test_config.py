@@ -0,0 +1,80 @@
+import json
+import os
+
+import pytest
+
+from mac_app_positioner import config
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    config._CONFIG_CACHE.clear()
+    yield
+    config._CONFIG_CACHE.clear()
+
+
+def write_yaml(path, text):
+    path.write_text(text)
+    return str(path)
+
+
+def forbid_yaml(monkeypatch):
+    def fail():
+        raise AssertionError("YAML was parsed")
+    monkeypatch.setattr(config, "_yaml_loader", fail)
+
+
+def test_cold_load_writes_sidecar(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "profiles:\n  home: {}\n")
+    assert config.load_config(path) == {'profiles': {'home': {}}}
+
+    with open(config._cache_path(path)) as file:
+        sidecar = json.load(file)
+    st = os.stat(path)
+    assert sidecar == {'stat': [st.st_mtime_ns, st.st_size], 'data': {'profiles': {'home': {}}}}
+
+
+def test_warm_load_skips_yaml(tmp_path, monkeypatch):
+    path = write_yaml(tmp_path / "config.yaml", "profiles:\n  home: {}\n")
+    config.load_config(path)
+    config._CONFIG_CACHE.clear()
+
+    forbid_yaml(monkeypatch)
+    assert config.load_config(path) == {'profiles': {'home': {}}}
+
+
+def test_stat_change_invalidates_cache(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "profiles:\n  home: {}\n")
+    config.load_config(path)
+    # Keep the old mtime (like cp -p or a backup restore); the size still changes
+    st = os.stat(path)
+    write_yaml(tmp_path / "config.yaml", "profiles:\n  office: {}\n")
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+    assert config.load_config(path) == {'profiles': {'office': {}}}
+    config._CONFIG_CACHE.clear()
+    assert config.load_config(path) == {'profiles': {'office': {}}}
+
+
+def test_non_json_config_writes_no_sidecar(tmp_path):
+    path = write_yaml(tmp_path / "config.yaml", "profiles:\n  2024: {}\n  on: {}\n")
+    expected = {'profiles': {2024: {}, True: {}}}
+    assert config.load_config(path) == expected
+    assert not os.path.exists(config._cache_path(path))
+
+    config._CONFIG_CACHE.clear()
+    assert config.load_config(path) == expected
+
+
+def test_remember_config_after_save(tmp_path, monkeypatch):
+    path = write_yaml(tmp_path / "config.yaml", "profiles:\n  home: {}\n")
+    config.load_config(path)
+
+    saved = {'profiles': {'home': {'monitors': [{'resolution': 'builtin', 'position': 'builtin'}]}}}
+    write_yaml(tmp_path / "config.yaml", "profiles:\n  home:\n    monitors:\n    - resolution: builtin\n      position: builtin\n")
+    config.remember_config(path, saved)
+
+    forbid_yaml(monkeypatch)
+    assert config.load_config(path) == saved
+    config._CONFIG_CACHE.clear()
+    assert config.load_config(path) == saved
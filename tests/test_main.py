@@ -0,0 +1,29 @@
+import pytest
+
+from mac_app_positioner.__main__ import parse_args
+
+
+@pytest.mark.parametrize("argv", [
+    ["--verbose", "position", "home"],
+    ["position", "--verbose", "home"],
+    ["position", "home", "--verbose"],
+])
+def test_verbose_anywhere(argv):
+    args = parse_args(argv)
+    assert args.verbose
+    assert args.command == "position"
+    assert args.args == ["home"]
+
+
+def test_no_arguments():
+    args = parse_args([])
+    assert not args.verbose
+    assert args.command is None
+    assert args.args == []
+
+
+@pytest.mark.parametrize("argv", [["--help"], ["position", "--help"], ["--verb"]])
+def test_unknown_option_is_reported_as_command(argv):
+    args = parse_args(argv)
+    assert args.command == argv[-1]
+    assert args.args == []
@@ -0,0 +1,63 @@
+from mac_app_positioner.geometry import Screen
+from mac_app_positioner.profiles import ProfileManager, resolution_key
+
+
+class FakeDisplayManager:
+    def __init__(self, *resolutions):
+        self.screens = [
+            Screen(index=i, name=None, width=w, height=h, resolution=f"{w}x{h}", x=0, y=0,
+                   is_main=i == 0, positioning_coords=None, translation_rule=None, source=None)
+            for i, (w, h) in enumerate(resolutions)
+        ]
+
+    def get_screens(self):
+        return self.screens
+
+
+def make_manager(profiles, *resolutions):
+    return ProfileManager({'profiles': profiles}, FakeDisplayManager(*resolutions), None)
+
+
+def test_resolution_key_malformed():
+    assert resolution_key("3840x2160") == resolution_key("3840x2160")
+    assert resolution_key("builtin") == "builtin"
+    for bad in ("3440X1440", "wide", None, [3840, 2160]):
+        assert resolution_key(bad) is None
+
+
+def test_malformed_profiles_do_not_match():
+    profiles = {
+        'no_monitors': {'layout': {}},
+        'list_resolution': {'monitors': [{'resolution': [3840, 2160], 'position': 'primary'}]},
+        'upper_x': {'monitors': [{'resolution': '3840X2160', 'position': 'primary'}]},
+        'home': {'monitors': [{'resolution': '3840x2160', 'position': 'primary'}]},
+    }
+    manager = make_manager(profiles, (3840, 2160))
+    assert 'list_resolution' not in manager._profile_masks
+    assert 'upper_x' not in manager._profile_masks
+    assert manager.detect_profile() == 'home'
+
+
+def test_more_external_resolutions_win_over_builtin_entries():
+    profiles = {
+        'laptop_4k': {'monitors': [
+            {'resolution': '3840x2160', 'position': 'primary'},
+            {'resolution': 'builtin', 'position': 'builtin'},
+        ]},
+        'desk': {'monitors': [
+            {'resolution': '3840x2160', 'position': 'primary'},
+            {'resolution': '2560x1440', 'position': 'left'},
+        ]},
+    }
+    assert make_manager(profiles, (3840, 2160), (2560, 1440)).detect_profile() == 'desk'
+    assert make_manager(profiles, (3840, 2160), (2056, 1329)).detect_profile() == 'laptop_4k'
+
+
+def test_ties_keep_config_order_and_missing_screens_do_not_match():
+    profiles = {
+        'first': {'monitors': [{'resolution': '3840x2160', 'position': 'primary'}]},
+        'second': {'monitors': [{'resolution': '3840x2160', 'position': 'primary'}]},
+        'office': {'monitors': [{'resolution': '3440x1440', 'position': 'primary'}]},
+    }
+    assert make_manager(profiles, (3840, 2160)).detect_profile() == 'first'
+    assert make_manager(profiles, (2560, 1440)).detect_profile() is None